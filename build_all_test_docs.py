@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Generate every test document image in parallel, one worker process per script
+"""
+
+import multiprocessing
+import os
+import runpy
+
+from create_test_docs import DOCUMENTS, SCRIPT_DIR
+
+SCRIPTS = [script for script, _ in DOCUMENTS.values()]
+
+def _call(script):
+    # The scripts are not importable (hyphenated names), so run each one as __main__
+    runpy.run_path(os.path.join(SCRIPT_DIR, script), run_name="__main__")
+
+if __name__ == "__main__":
+    with multiprocessing.Pool(len(SCRIPTS)) as p:
+        p.map(_call, SCRIPTS)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Build the mrz.pil/mrz.pbm bitmap font used for passport MRZ lines
+
+Rasterizes printable ASCII from DejaVu Sans Mono with FreeType once, without
+antialiasing, and saves it in Pillow's own bitmap font format (the same output
+pilfont.py writes for a BDF font). Re-run after changing MRZ_SOURCE or MRZ_SIZE:
+
+    python3 build_mrz_font.py
+"""
+
+from PIL import FontFile, Image, ImageDraw, ImageFont
+
+from fonts import MRZ_FONT_PATH
+
+MRZ_SOURCE = "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf"
+MRZ_SIZE = 10  # the passport template's small text size
+
+class RasterizedFont(FontFile.FontFile):
+    """FontFile filled from a TrueType face instead of a BDF/PCF file"""
+
+    def __init__(self, path, size, chars):
+        super().__init__()
+        font = ImageFont.truetype(path, size)
+        for ch in chars:
+            advance = round(font.getlength(ch))
+            # Glyph box relative to the baseline origin, as BDF's BBX describes it
+            x0, y0, x1, y1 = font.getbbox(ch, anchor='ls') if ch.strip() else (0, 0, 0, 0)
+            image = Image.new('1', (x1 - x0, y1 - y0))
+            if ch.strip():
+                draw = ImageDraw.Draw(image)
+                draw.fontmode = '1'
+                draw.text((-x0, -y0), ch, font=font, fill=1, anchor='ls')
+            self.glyph[ord(ch)] = (advance, 0), (x0, y0, x1, y1), (0, 0, x1 - x0, y1 - y0), image
+
+if __name__ == "__main__":
+    RasterizedFont(MRZ_SOURCE, MRZ_SIZE, [chr(i) for i in range(32, 127)]).save(MRZ_FONT_PATH)
+    print(f"Wrote {MRZ_FONT_PATH} and its .pbm bitmap")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Generate test document images in a single process, so Pillow, FreeType and the
+shared fonts/templates are only loaded once for the whole batch
+
+Usage:
+    python3 create_test_docs.py --all
+    python3 create_test_docs.py passport visa
+"""
+
+import argparse
+import importlib
+import importlib.util
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Document name -> (script, generator function that renders, saves and prints the summary)
+DOCUMENTS = {
+    "aadhaar": ("create-test-aadhaar.py", "create_test_aadhaar"),
+    "pan": ("create-test-pan.py", "create_test_pan"),
+    "passport": ("create-test-passport.py", "main"),
+    "visa": ("create-test-visa.py", "main"),
+}
+
+def module_name(script):
+    return script[:-len(".py")].replace("-", "_")
+
+def load_generator(name):
+    script, func = DOCUMENTS[name]
+    try:
+        # Extension built by `python3 setup.py build_ext --inplace`
+        module = importlib.import_module(module_name(script))
+    except ModuleNotFoundError as exc:
+        # Only a missing extension falls back; a missing dependency inside it is a real error
+        if exc.name != module_name(script):
+            raise
+        # The scripts have hyphenated names, so import them by path instead of by module name
+        spec = importlib.util.spec_from_file_location(module_name(script), os.path.join(SCRIPT_DIR, script))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return getattr(module, func)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate test document images")
+    parser.add_argument("documents", nargs="*", help=f"documents to generate ({', '.join(DOCUMENTS)})")
+    parser.add_argument("--all", action="store_true", help="generate every test document")
+    args = parser.parse_args()
+
+    names = list(DOCUMENTS) if args.all else args.documents
+    if not names:
+        parser.error("name at least one document or pass --all")
+    unknown = [name for name in names if name not in DOCUMENTS]
+    if unknown:
+        parser.error(f"unknown document(s): {', '.join(unknown)}")
+
+    for name in names:
+        load_generator(name)()
+
+if __name__ == "__main__":
+    main()
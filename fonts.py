@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Shared font loading and text drawing for the create-test-*.py document image scripts
+"""
+
+import functools
+import os
+
+from PIL import ImageFont
+
+# Resolve the font once at import; Arial on macOS, DejaVu Sans on Linux, else Pillow's default
+FONT_CANDIDATES = (
+    "/System/Library/Fonts/Arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+)
+FONT_PATH = next((path for path in FONT_CANDIDATES if os.path.exists(path)), None)
+
+@functools.lru_cache(maxsize=None)
+def load_fonts(large, medium, small):
+    # FreeType faces are expensive to build, so each size set is opened once per process
+    if FONT_PATH is None:
+        font = ImageFont.load_default()
+        return font, font, font
+    return (
+        ImageFont.truetype(FONT_PATH, large),
+        ImageFont.truetype(FONT_PATH, medium),
+        ImageFont.truetype(FONT_PATH, small),
+    )
+
+# Fixed-width bitmap font for passport MRZ lines (DejaVu Sans Mono 10 px), built by build_mrz_font.py
+MRZ_FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mrz.pil")
+
+@functools.lru_cache(maxsize=None)
+def load_mrz_font():
+    # Bitmap fonts bypass FreeType/Raqm layout; if mrz.pil is missing use Pillow's built-in
+    # fixed-width bitmap font (load_default() itself is that font before Pillow 10.1)
+    if os.path.exists(MRZ_FONT_PATH):
+        return ImageFont.load(MRZ_FONT_PATH)
+    return getattr(ImageFont, "load_default_imagefont", ImageFont.load_default)()
+
+@functools.lru_cache(maxsize=None)
+def _text_mask(font, text, mode):
+    # Same mask ImageDraw.text would rasterize for a single left-aligned line
+    if isinstance(font, ImageFont.FreeTypeFont):
+        return font.getmask2(text, mode)
+    return font.getmask(text, mode), (0, 0)
+
+def draw_text_cached(draw, xy, text, font, fill):
+    # Drop-in for draw.text() that lays out and rasterizes each (font, text) pair only once
+    mask, offset = _text_mask(font, text, draw.fontmode)
+    ink = draw._getink(fill)[0]
+    draw.draw.draw_bitmap((int(xy[0]) + offset[0], int(xy[1]) + offset[1]), mask, ink)
+
+def draw_lines_cached(draw, xy, lines, font, fill, line_step):
+    # One call for a block of lines at a fixed vertical step; unlike draw.multiline_text()
+    # this keeps the scripts' exact y positions and only resolves the ink once
+    x, y = int(xy[0]), int(xy[1])
+    ink = draw._getink(fill)[0]
+    for i, text in enumerate(lines):
+        mask, offset = _text_mask(font, text, draw.fontmode)
+        draw.draw.draw_bitmap((x + offset[0], y + i * line_step + offset[1]), mask, ink)
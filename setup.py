@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Optional Cython build of the create-test-*.py document image scripts
+
+Usage:
+    python3 setup.py build_ext --inplace
+
+Each script compiles in pure-Python mode to an extension named with underscores
+(create_test_aadhaar, ...), which create_test_docs.py prefers over the source script.
+The shared renderer modules are compiled alongside and shadow their .py files, so
+rebuild after editing any of them, or delete the extensions to go back to the source.
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+from create_test_docs import DOCUMENTS, module_name
+
+SHARED_MODULES = ("fonts", "test_id_renderer")
+
+setup(
+    name="create-test-docs",
+    ext_modules=cythonize(
+        [Extension(module_name(script), [script]) for script, _ in DOCUMENTS.values()]
+        + [Extension(name, [f"{name}.py"]) for name in SHARED_MODULES],
+        language_level=3,
+    ),
+)
@@ -13,6 +13,8 @@ GREEN='\033[0;32m'
 YELLOW='\033[1;33m'
 NC='\033[0m' # No Color
 
+source "$(dirname "$0")/test-image-helpers.sh"
+
 # Check if backend is running
 echo "Checking if backend is running..."
 if curl -s http://localhost:4000/health > /dev/null; then
@@ -52,14 +54,16 @@ echo "━━━━━━━━━━━━━━━━━━━━━━━━
 echo "Testing: Passport Auto-Fill"
 echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
 
-if [ ! -f "passport.jpg" ]; then
+# Prefer an existing passport.jpg, otherwise use (or generate) passport.png
+PASSPORT_IMAGE=$(test_image passport)
+if [ ! -f "$PASSPORT_IMAGE" ]; then
     echo "Creating test passport image..."
     python3 create-test-passport.py
 fi
 
 # Convert image to base64
 echo "Converting passport image to base64..."
-BASE64_DATA=$(base64 -i passport.jpg)
+BASE64_DATA=$(base64 -i "$PASSPORT_IMAGE")
 BASE64_SIZE=$(echo -n "$BASE64_DATA" | wc -c)
 
 echo "Base64 data length: $BASE64_SIZE characters"
@@ -72,8 +76,8 @@ UPLOAD_RESPONSE=$(curl -s -X POST http://localhost:4000/guest-checkin/documents/
   -d "{
     \"documentType\": \"passport\",
     \"fileData\": \"$BASE64_DATA\",
-    \"filename\": \"passport.jpg\",
-    \"mimeType\": \"image/jpeg\",
+    \"filename\": \"$PASSPORT_IMAGE\",
+    \"mimeType\": \"$(image_mime "$PASSPORT_IMAGE")\",
     \"performExtraction\": true
   }")
 
@@ -128,14 +132,16 @@ echo "━━━━━━━━━━━━━━━━━━━━━━━━
 echo "Testing: Visa Auto-Fill"
 echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
 
-if [ ! -f "visa.jpg" ]; then
+# Prefer an existing visa.jpg, otherwise use (or generate) visa.png
+VISA_IMAGE=$(test_image visa)
+if [ ! -f "$VISA_IMAGE" ]; then
     echo "Creating test visa image..."
     python3 create-test-visa.py
 fi
 
 # Convert visa image to base64
 echo "Converting visa image to base64..."
-BASE64_DATA=$(base64 -i visa.jpg)
+BASE64_DATA=$(base64 -i "$VISA_IMAGE")
 BASE64_SIZE=$(echo -n "$BASE64_DATA" | wc -c)
 
 echo "Base64 data length: $BASE64_SIZE characters"
@@ -148,8 +154,8 @@ UPLOAD_RESPONSE=$(curl -s -X POST http://localhost:4000/guest-checkin/documents/
   -d "{
     \"documentType\": \"visa_front\",
     \"fileData\": \"$BASE64_DATA\",
-    \"filename\": \"visa.jpg\",
-    \"mimeType\": \"image/jpeg\",
+    \"filename\": \"$VISA_IMAGE\",
+    \"mimeType\": \"$(image_mime "$VISA_IMAGE")\",
     \"performExtraction\": true
   }")
 
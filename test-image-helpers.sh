@@ -0,0 +1,22 @@
+#!/bin/bash
+
+# Shared helpers for the test-*.sh upload scripts; source it, don't run it:
+#   source "$(dirname "$0")/test-image-helpers.sh"
+
+# Path of a test document image: an existing <name>.jpg scan, otherwise the
+# <name>.png written by create-test-<name>.py
+test_image() {
+    if [ -f "$1.jpg" ]; then
+        echo "$1.jpg"
+    else
+        echo "$1.png"
+    fi
+}
+
+# MIME type for an image path (.png from create-test-*.py, or a .jpg scan)
+image_mime() {
+    case "$1" in
+        *.png) echo "image/png" ;;
+        *) echo "image/jpeg" ;;
+    esac
+}
@@ -15,6 +15,12 @@ else
 fi
 echo
 
+source "$(dirname "$0")/test-image-helpers.sh"
+
+# Prefer existing .jpg scans, otherwise the .png images from create-test-*.py
+AADHAAR_IMAGE=$(test_image aadhaar)
+PAN_IMAGE=$(test_image pan)
+
 # Login and get token
 echo "Logging in..."
 LOGIN_RESPONSE=$(curl -s -X POST http://localhost:4000/auth/login \
@@ -38,7 +44,7 @@ echo "━━━━━━━━━━━━━━━━━━━━━━━━
 
 # Convert Aadhaar image to base64
 echo "Converting Aadhaar image to base64..."
-BASE64_DATA=$(base64 -i aadhaar.jpg)
+BASE64_DATA=$(base64 -i "$AADHAAR_IMAGE")
 BASE64_SIZE=$(echo -n "$BASE64_DATA" | wc -c)
 
 echo "Base64 data length:    $BASE64_SIZE characters"
@@ -51,8 +57,8 @@ UPLOAD_RESPONSE=$(curl -s -X POST http://localhost:4000/guest-checkin/documents/
   -d "{
     \"documentType\": \"aadhaar_front\",
     \"fileData\": \"$BASE64_DATA\",
-    \"filename\": \"aadhaar.jpg\",
-    \"mimeType\": \"image/jpeg\",
+    \"filename\": \"$AADHAAR_IMAGE\",
+    \"mimeType\": \"$(image_mime "$AADHAAR_IMAGE")\",
     \"performExtraction\": true
   }")
 
@@ -122,7 +128,7 @@ echo "━━━━━━━━━━━━━━━━━━━━━━━━
 
 # Convert PAN image to base64
 echo "Converting PAN image to base64..."
-BASE64_DATA=$(base64 -i pan.jpg)
+BASE64_DATA=$(base64 -i "$PAN_IMAGE")
 BASE64_SIZE=$(echo -n "$BASE64_DATA" | wc -c)
 
 echo "Base64 data length:    $BASE64_SIZE characters"
@@ -135,8 +141,8 @@ UPLOAD_RESPONSE=$(curl -s -X POST http://localhost:4000/guest-checkin/documents/
   -d "{
     \"documentType\": \"pan_card\",
     \"fileData\": \"$BASE64_DATA\",
-    \"filename\": \"pan.jpg\",
-    \"mimeType\": \"image/jpeg\",
+    \"filename\": \"$PAN_IMAGE\",
+    \"mimeType\": \"$(image_mime "$PAN_IMAGE")\",
     \"performExtraction\": true
   }")
 
@@ -18,6 +18,8 @@ YELLOW='\033[1;33m'
 BLUE='\033[0;34m'
 NC='\033[0m' # No Color
 
+source "$(dirname "$0")/test-image-helpers.sh"
+
 # Function to check if backend is running
 check_backend() {
   echo "Checking if backend is running..."
@@ -103,7 +105,7 @@ test_real_document() {
   "documentType": "${document_type}",
   "fileData": "${BASE64_DATA}",
   "filename": "$(basename $image_file)",
-  "mimeType": "image/jpeg",
+  "mimeType": "$(image_mime "$image_file")",
   "performExtraction": true
 }
 EOF
@@ -240,19 +242,21 @@ main() {
   echo "Testing with provided document images..."
   
   # Test Estonian passport
-  if [ -f "passport.jpg" ]; then
-    test_real_document "passport.jpg" "passport" "Estonian Passport Extraction"
+  passport_image=$(test_image passport)
+  if [ -f "$passport_image" ]; then
+    test_real_document "$passport_image" "passport" "Estonian Passport Extraction"
   else
-    echo -e "${YELLOW}⚠ passport.jpg not found in current directory${NC}"
-    echo "Please ensure the Estonian passport image is named 'passport.jpg' in the project root"
+    echo -e "${YELLOW}⚠ passport.jpg / passport.png not found in current directory${NC}"
+    echo "Please ensure the Estonian passport image is named 'passport.jpg' (or run create-test-passport.py) in the project root"
   fi
   
   # Test Indian visa
-  if [ -f "visa.jpg" ]; then
-    test_real_document "visa.jpg" "visa_front" "Indian Visa Extraction"
+  visa_image=$(test_image visa)
+  if [ -f "$visa_image" ]; then
+    test_real_document "$visa_image" "visa_front" "Indian Visa Extraction"
   else
-    echo -e "${YELLOW}⚠ visa.jpg not found in current directory${NC}"
-    echo "Please ensure the Indian visa image is named 'visa.jpg' in the project root"
+    echo -e "${YELLOW}⚠ visa.jpg / visa.png not found in current directory${NC}"
+    echo "Please ensure the Indian visa image is named 'visa.jpg' (or run create-test-visa.py) in the project root"
   fi
   
   echo ""
@@ -1,6 +1,9 @@
 #!/bin/bash
 
 # Test Personal Information Auto-Fill
+
+source "$(dirname "$0")/test-image-helpers.sh"
+
 echo "🧪 Testing Personal Information Auto-Fill"
 echo "=========================================="
 echo
@@ -36,9 +39,10 @@ echo "━━━━━━━━━━━━━━━━━━━━━━━━
 echo "Testing: Personal Information Auto-Fill"
 echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
 
-# Convert passport image to base64
+# Convert passport image to base64 (passport.jpg scan, else passport.png from create-test-passport.py)
+PASSPORT_IMAGE=$(test_image passport)
 echo "Converting passport image to base64..."
-BASE64_DATA=$(base64 -i passport.jpg)
+BASE64_DATA=$(base64 -i "$PASSPORT_IMAGE")
 BASE64_SIZE=$(echo -n "$BASE64_DATA" | wc -c)
 
 echo "Base64 data length:    $BASE64_SIZE characters"
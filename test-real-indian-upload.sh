@@ -1,9 +1,11 @@
 #!/bin/bash
 
+source "$(dirname "$0")/test-image-helpers.sh"
+
 # --- Configuration ---
 BACKEND_URL="http://localhost:4000"
 FRONTEND_URL="http://localhost:5174"
-AADHAAR_IMAGE="aadhaar.jpg"
+AADHAAR_IMAGE=$(test_image aadhaar)  # aadhaar.jpg scan, else aadhaar.png from create-test-aadhaar.py
 
 # --- Helper Functions ---
 check_backend_status() {
@@ -45,7 +47,7 @@ upload_document() {
       \"documentType\": \"$doc_type\",
       \"fileData\": \"$BASE64_DATA\",
       \"filename\": \"$image_file\",
-      \"mimeType\": \"image/jpeg\",
+      \"mimeType\": \"$(image_mime "$image_file")\",
       \"performExtraction\": true
     }")
 
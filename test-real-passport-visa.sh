@@ -18,6 +18,8 @@ YELLOW='\033[1;33m'
 BLUE='\033[0;34m'
 NC='\033[0m' # No Color
 
+source "$(dirname "$0")/test-image-helpers.sh"
+
 # Function to check if backend is running
 check_backend() {
   echo "Checking if backend is running..."
@@ -104,7 +106,7 @@ test_real_document() {
   "documentType": "${document_type}",
   "fileData": "${BASE64_DATA}",
   "filename": "$(basename $image_file)",
-  "mimeType": "image/jpeg",
+  "mimeType": "$(image_mime "$image_file")",
   "performExtraction": true
 }
 EOF
@@ -240,9 +242,9 @@ main() {
   echo ""
   echo "Looking for real document images..."
   
-  # Check for common image file names
-  PASSPORT_FILES=("passport.jpg" "passport.jpeg" "passport.png" "real-passport.jpg" "test-passport.jpg")
-  VISA_FILES=("visa.jpg" "visa.jpeg" "visa.png" "real-visa.jpg" "test-visa.jpg")
+  # Check for common image file names; passport.jpg / passport.png (and visa) come first via test_image
+  PASSPORT_FILES=("$(test_image passport)" "passport.jpeg" "real-passport.jpg" "test-passport.jpg")
+  VISA_FILES=("$(test_image visa)" "visa.jpeg" "real-visa.jpg" "test-visa.jpg")
   
   PASSPORT_FOUND=""
   VISA_FOUND=""
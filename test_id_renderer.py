@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Template-driven renderer shared by the create-test-*.py document image scripts
+
+Each entry in TEMPLATES describes one document: canvas size/mode/background, font
+sizes, filled and outlined boxes, static text and the data-driven field blocks.
+Static parts are rendered once per process; render() only draws the fields.
+"""
+
+from PIL import Image, ImageDraw
+import functools
+
+from fonts import draw_lines_cached, draw_text_cached, load_fonts, load_mrz_font
+
+# Boxes are [x0, y0, x1, y1] with inclusive corners, the same as draw.rectangle().
+# "fills": (box, color), "outlines": (box, color, width), "texts": (xy, text, font, fill),
+# "fields": (xy, font, fill, line_step, lines) where each line is a prebuilt (label, key) pair,
+# drawn as label + data[key] (or the bare label when key is None).
+# Fonts are "large", "medium" and "small" at the template's sizes, plus the fixed-width "mrz" bitmap font.
+# "header" is an optional RGB band pasted over an 'L' canvas after conversion.
+TEMPLATES = {
+    "aadhaar": {
+        "size": (600, 400),
+        "mode": 'L',
+        "background": 255,
+        "fonts": (24, 16, 12),
+        "header": {
+            "size": (600, 61),
+            "background": '#FF6B35',
+            "texts": [
+                ((20, 20), "Government of India", "large", 'white'),
+                ((20, 45), "Aadhaar", "medium", 'white'),
+            ],
+        },
+        "outlines": [
+            ([400, 80, 580, 260], 0, 2),  # QR code placeholder
+        ],
+        "texts": [
+            ((420, 170), "QR Code", "small", 0),
+            ((20, 370), "This is a test Aadhaar card for development purposes", "small", 128),
+        ],
+        "fields": [
+            ((20, 80), "medium", 0, 25, [
+                ("Name: ", "name"),
+                ("Aadhaar No: ", "aadhaar_number"),
+                ("Date of Birth: ", "date_of_birth"),
+                ("Gender: ", "gender"),
+                ("Father's Name: ", "father_name"),
+                ("Address: ", "address"),
+            ]),
+        ],
+    },
+    "pan": {
+        "size": (600, 400),
+        "mode": 'RGB',
+        "background": '#D2B48C',  # Tan background
+        "fonts": (24, 16, 12),
+        "fills": [
+            ([0, 0, 600, 60], '#8B4513'),  # Header
+        ],
+        "outlines": [
+            ([400, 150, 580, 200], 'black', 1),  # Signature placeholder
+        ],
+        "texts": [
+            ((20, 20), "INCOME TAX DEPARTMENT", "large", 'white'),
+            ((20, 45), "GOVT. OF INDIA", "medium", 'white'),
+            ((20, 80), "Permanent Account Number Card", "medium", 'black'),
+            ((420, 175), "Signature", "small", 'black'),
+            ((20, 370), "This is a test PAN card for development purposes", "small", 'gray'),
+        ],
+        "fields": [
+            ((20, 110), "medium", 'black', 25, [
+                ("Name: ", "name"),
+                ("Father's Name: ", "father_name"),
+                ("Date of Birth: ", "date_of_birth"),
+                ("PAN: ", "pan_number"),
+            ]),
+        ],
+    },
+    "passport": {
+        "size": (600, 400),
+        "mode": 'L',
+        "background": 255,
+        "fonts": (16, 12, 10),
+        "outlines": [
+            ([10, 10, 590, 50], 0, 2),  # Header
+            ([10, 340, 590, 390], 0, 1),  # MRZ box
+        ],
+        "texts": [
+            ((20, 20), "ESTONIAN PASSPORT", "large", 0),
+        ],
+        "fields": [
+            ((20, 70), "medium", 0, 20, [
+                ("Liik/Type: ", "type"),
+                ("Riigi kood/Country code: ", "country_code"),
+            ]),
+            ((20, 120), "medium", 0, 20, [
+                ("1. Perekonnanimi / Surname: ", "surname"),
+                ("2. Eesnimi / Given name: ", "given_name"),
+                ("3. Isikukood / Personal code: ", "personal_code"),
+                ("4. Kodakondsus / Citizenship: ", "citizenship"),
+                ("5. Sünniaeg / Date of birth: ", "date_of_birth"),
+                ("6. Sugu / Sex: ", "sex"),
+                ("7. Sünnikoht / Place of birth: Tallinn, Estonia", None),
+                ("8. Aadress / Address: Tallinn, Estonia", None),
+            ]),
+            ((300, 260), "medium", 0, 20, [
+                ("Dokumendi number: ", "document_number"),
+                ("8. Välja antud: ", "date_of_issue"),
+                ("9. Kehtiv kuni: ", "date_of_expiry"),
+                ("11. Väljaandja: ", "authority"),
+                ("Address: Police and Border Guard Board, Tallinn, Estonia", None),
+            ]),
+            ((15, 350), "mrz", 0, 15, [
+                ("", "mrz_line1"),
+                ("", "mrz_line2"),
+            ]),
+        ],
+    },
+    "visa": {
+        "size": (500, 450),
+        "mode": 'RGB',
+        "background": 'white',
+        "fonts": (14, 11, 9),
+        "outlines": [
+            ([5, 5, 495, 445], 'blue', 3),  # Border
+            ([10, 10, 490, 50], 'black', 2),  # Header
+        ],
+        "texts": [
+            ((20, 20), "INDIAN VISA", "large", 'black'),
+        ],
+        "fields": [
+            ((20, 70), "medium", 'black', 20, [
+                ("Visa Type: ", "visa_type"),
+                ("Visa Category: ", "visa_category"),
+                ("Visa Number: ", "visa_number"),
+                ("Country: ", "country"),
+                ("Authority: ", "authority"),
+                ("Place of Issue: ", "place_of_issue"),
+                ("Purpose: ", "purpose_of_visit"),
+            ]),
+            ((20, 200), "medium", 'red', 20, [
+                ("Issue Date: ", "issue_date"),
+            ]),
+            ((20, 220), "medium", 'black', 20, [
+                ("Expiry Date: ", "expiry_date"),
+            ]),
+            ((20, 250), "medium", 'black', 20, [
+                ("Port of Entry: ", "port_of_entry"),
+                ("Entries: ", "entries"),
+                ("Stay Duration: ", "stay_duration"),
+                ("Nationality: ", "nationality"),
+                ("Passport No: ", "passport_number"),
+                ("Status: ", "visa_status"),
+                ("Remarks: ", "remarks"),
+            ]),
+        ],
+    },
+}
+
+def _fonts(template):
+    fonts = dict(zip(("large", "medium", "small"), load_fonts(*template["fonts"])))
+    fonts["mrz"] = load_mrz_font()
+    return fonts
+
+def _draw_texts(image, texts, fonts):
+    draw = ImageDraw.Draw(image)
+    for xy, text, font, fill in texts:
+        draw_text_cached(draw, xy, text, fonts[font], fill)
+
+@functools.lru_cache(maxsize=None)
+def _build_header(name):
+    template = TEMPLATES[name]
+    header = template["header"]
+    image = Image.new('RGB', header["size"], header["background"])
+    _draw_texts(image, header["texts"], _fonts(template))
+    return image
+
+@functools.lru_cache(maxsize=None)
+def _build_template(name):
+    # Static layout, rendered once; render() draws the document data on a copy
+    template = TEMPLATES[name]
+    image = Image.new(template["mode"], template["size"], template["background"])
+    draw = ImageDraw.Draw(image)
+    for box, color in template.get("fills", ()):
+        draw.rectangle(box, fill=color)
+    for box, color, width in template.get("outlines", ()):
+        draw.rectangle(box, outline=color, width=width)
+    _draw_texts(image, template.get("texts", ()), _fonts(template))
+    return image
+
+def render(name, data):
+    """Render the named document with data and return it as an RGB image"""
+    template = TEMPLATES[name]
+    fonts = _fonts(template)
+    image = _build_template(name).copy()
+    draw = ImageDraw.Draw(image)
+    for xy, font, fill, line_step, lines in template["fields"]:
+        text = [label if key is None else label + data[key] for label, key in lines]
+        draw_lines_cached(draw, xy, text, fonts[font], fill, line_step)
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    if "header" in template:
+        image.paste(_build_header(name), (0, 0))
+    return image
+
+def save(image, path):
+    # Flat synthetic cards: fast zlib on long pixel runs beats DCT/Huffman and skips YCbCr
+    image.save(path, 'PNG', optimize=False, compress_level=1)